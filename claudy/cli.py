@@ -1,19 +1,25 @@
 #!/usr/bin/env python3
 """CLI for Claudy - Universal Claude agent manager."""
 
-import argparse
-import json
+import atexit
 import os
+import select
+import signal
+import socket
 import subprocess
 import sys
 import time
+from functools import partial
+from typing import TYPE_CHECKING
 
-import anyio
-from fastmcp import Client
-
+from . import __version__
 from .config import (
     DEFAULT_HOST,
     DEFAULT_PORT,
+    LOG_FILE,
+    SERVER_KEEPALIVE_TIMEOUT,
+    SERVER_STARTUP_TIMEOUT,
+    SOCKET_FILE,
     VERBOSITY_QUIET,
     VERBOSITY_NORMAL,
     VERBOSITY_VERBOSE,
@@ -21,37 +27,305 @@ from .config import (
     get_server_port,
     save_server_pid,
     save_server_port,
+    clear_server_alive,
     clear_server_info,
+    ensure_claudy_dir,
+    is_server_recently_alive,
+    mark_server_alive,
+)
+from .json_utils import JSONDecodeError, dumps, loads
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from fastmcp import Client
+
+# Static outputs, serialized once at import time
+_MSG_SERVER_STARTED = dumps({"success": True, "message": "Server started"})
+_MSG_SERVER_RESTARTED = dumps({"success": True, "message": "Server restarted"})
+_MSG_SERVER_STOPPED = dumps({"success": True, "message": "Server stopped"})
+_MSG_SERVER_WAS_NOT_RUNNING = dumps({"success": True, "message": "Server was not running"})
+_MSG_SERVER_ALREADY_RUNNING = dumps({"success": True, "message": "Server is already running"})
+_MSG_SERVER_NOT_RUNNING = dumps({"success": True, "running": False})
+_ERR_SERVER_START = dumps({"success": False, "error": "Failed to start server"})
+_ERR_SERVER_RESTART = dumps({"success": False, "error": "Failed to restart server"})
+_ERR_SERVER_NOT_RUNNING = dumps(
+    {
+        "success": False,
+        "error": "Server is not running",
+        "error_code": "SERVER_NOT_RUNNING",
+    }
+)
+_ERR_SERVER_NOT_STARTED = dumps(
+    {
+        "success": False,
+        "error": "Server is not running. Start it with: claudy server start",
+        "error_code": "SERVER_NOT_RUNNING",
+    }
+)
+_ERR_CLEANUP_ARGS = dumps(
+    {
+        "success": False,
+        "error": "Either provide a session name or use --all",
+    }
+)
+_ERR_INTERRUPTED = dumps(
+    {
+        "success": False,
+        "error": "Interrupted by user",
+        "error_code": "INTERRUPTED",
+    }
 )
 
+# Event loop and MCP client shared by every server call in this process
+_loop = None
+_client = None
+
+
+def _get_loop() -> "asyncio.AbstractEventLoop":
+    """Return the process-wide event loop, creating it on first use."""
+    global _loop
+    if _loop is None:
+        # Imported lazily so commands that never reach the server skip the cost
+        try:
+            import uvloop
+        except ImportError:  # optional speedup (pip install claudy[fast])
+            import asyncio
+
+            _loop = asyncio.new_event_loop()
+        else:
+            _loop = uvloop.new_event_loop()
+        atexit.register(_shutdown_loop)
+    return _loop
+
+
+def _run(coro):
+    """Run a coroutine to completion on the shared event loop."""
+    return _get_loop().run_until_complete(coro)
+
+
+async def _get_client() -> "Client":
+    """Return a connected client for the daemon, connecting once per process."""
+    global _client
+    if _client is None:
+        # fastmcp pulls in httpx/anyio/mcp, only pay for it when dialing the server
+        from .transport import create_client
+
+        client = create_client()
+        await client.__aenter__()
+        _client = client
+    return _client
+
+
+async def _close_client() -> None:
+    """Disconnect the shared client, if any."""
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        try:
+            await client.__aexit__(None, None, None)
+        except Exception:
+            pass  # Best effort cleanup
+
+
+def _shutdown_loop() -> None:
+    """Close the shared client and event loop on process exit."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        return
+    try:
+        _loop.run_until_complete(_close_client())
+    finally:
+        _loop.close()
+        _loop = None
+
 
 def is_server_running():
     """Check if the HTTP server is running."""
-    port = get_server_port()
+    # Back-to-back invocations (e.g. shell loops) reuse a very recent confirmation
+    if is_server_recently_alive():
+        return True
+
     pid = get_server_pid()
 
-    if not port or not pid:
+    if not pid or not (SOCKET_FILE.exists() or get_server_port()):
         return False
 
     # Check if process is alive
-    try:
-        os.kill(pid, 0)  # Signal 0 doesn't kill, just checks if process exists
+    if _is_process_alive(pid):
+        mark_server_alive()
         return True
-    except (OSError, ProcessLookupError):
-        # Process doesn't exist, clean up stale files
-        clear_server_info()
+
+    # Process doesn't exist, clean up stale files
+    clear_server_info()
+    return False
+
+
+def _can_connect(address) -> bool:
+    """Try one connection to a (host, port) pair or a Unix socket path."""
+    try:
+        if isinstance(address, tuple):
+            sock = socket.create_connection(address, timeout=0.05)
+        else:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(0.05)
+            try:
+                sock.connect(address)
+            except OSError:
+                sock.close()
+                raise
+    except OSError:
         return False
 
+    sock.close()
+    return True
+
+
+def _wait_for_server(address, timeout: float, has_exited=None) -> bool:
+    """Wait until the server accepts connections (retries with exponential backoff)."""
+    deadline = time.monotonic() + timeout
+    delay = 0.02
+
+    while True:
+        if _can_connect(address):
+            return True
+
+        # Bail out early if the server process already died
+        if has_exited is not None and has_exited():
+            return False
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.2)
+
+
+def _open_pidfd(pid: int) -> int | None:
+    """Open a pidfd for the process (Linux 5.3+, Python 3.9+).
+
+    Returns None when pidfds are unsupported. Raises ProcessLookupError if the
+    process does not exist.
+    """
+    if not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except ProcessLookupError:
+        raise
+    except OSError:
+        return None  # e.g. kernel without pidfd support
+
+
+def _send_signal(pid: int, pidfd: int | None, sig: int) -> None:
+    """Signal a process, through its pidfd when available (immune to PID reuse)."""
+    if pidfd is not None:
+        signal.pidfd_send_signal(pidfd, sig)
+    else:
+        os.kill(pid, sig)
+
+
+def _wait_for_exit(pid: int, pidfd: int | None, timeout: float) -> bool:
+    """Wait for a process to exit. Returns True if it exited within timeout."""
+    if pidfd is not None:
+        # pidfd becomes readable when the process exits
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)
+        return bool(poller.poll(int(timeout * 1000)))
+
+    # Fallback: poll with signal 0
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.kill(pid, 0)
+        except (OSError, ProcessLookupError):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+
+
+def _is_process_alive(pid: int) -> bool:
+    """Check whether a process exists and has not exited."""
+    try:
+        pidfd = _open_pidfd(pid)
+    except ProcessLookupError:
+        return False
+
+    try:
+        return not _wait_for_exit(pid, pidfd, 0)
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+
+
+def _child_exited(pid: int) -> bool:
+    """Reap a forked child without blocking. Returns True if it has exited."""
+    try:
+        return os.waitpid(pid, os.WNOHANG)[0] != 0
+    except ChildProcessError:
+        return True
+
+
+def _process_exited(process: "subprocess.Popen") -> bool:
+    """Check whether a spawned server process has exited, without blocking."""
+    return process.poll() is not None
+
+
+def _fork_server(http: bool) -> int:
+    """Fork and run the FastMCP server in the child. Returns the child PID."""
+    pid = os.fork()
+    if pid:
+        return pid
+
+    # Child: detach from the terminal and send output to the server log
+    exit_code = 0
+    try:
+        os.setsid()
+        devnull_fd = os.open(os.devnull, os.O_RDONLY)
+        log_fd = os.open(LOG_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        os.dup2(devnull_fd, 0)
+        os.dup2(log_fd, 1)
+        os.dup2(log_fd, 2)
+        os.close(devnull_fd)
+        os.close(log_fd)
+
+        from .mcp_server import mcp
+
+        if http:
+            mcp.run(
+                transport="http",
+                host=DEFAULT_HOST,
+                port=DEFAULT_PORT,
+                uvicorn_config={"timeout_keep_alive": SERVER_KEEPALIVE_TIMEOUT},
+            )
+        else:
+            mcp.run(
+                transport="http",
+                uvicorn_config={
+                    "uds": str(SOCKET_FILE),
+                    "timeout_keep_alive": SERVER_KEEPALIVE_TIMEOUT,
+                },
+            )
+    except BaseException:
+        import traceback
+
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        # Never return into the parent's CLI code (or run its atexit handlers)
+        os._exit(exit_code)
 
-def start_server():
-    """Start the FastMCP HTTP server in the background using uv run."""
+
+def _spawn_server_process(http: bool) -> "subprocess.Popen":
+    """Start the FastMCP server as a subprocess (for platforms without fork)."""
     # Get the path to mcp_server.py
     import pathlib
     mcp_server_path = pathlib.Path(__file__).parent / "mcp_server.py"
 
-    # Start server using uv run fastmcp
-    process = subprocess.Popen(
-        [
+    if http:
+        # Start server using uv run fastmcp
+        command = [
             "uv",
             "run",
             "fastmcp",
@@ -61,124 +335,216 @@ def start_server():
             "http",
             "--port",
             str(DEFAULT_PORT),
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-    )
+        ]
+    else:
+        # Run the server module with this interpreter so claudy is importable
+        command = [sys.executable, "-m", "claudy.mcp_server", "--uds", str(SOCKET_FILE)]
+
+    with open(LOG_FILE, "ab") as log_file:
+        return subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+        )
 
-    # Save PID and PORT
-    save_server_pid(process.pid)
-    save_server_port(DEFAULT_PORT)
 
-    # Give it a moment to initialize
-    time.sleep(2)
+def start_server(http: bool = False):
+    """Start the FastMCP server in the background.
 
-    # Check if it's running - try to connect with FastMCP Client
-    try:
-        async def check_health():
-            client = Client(f"http://{DEFAULT_HOST}:{DEFAULT_PORT}/mcp")
-            async with client:
-                # Try to list tools as a health check
-                await client.list_tools()
-                return True
-
-        return anyio.run(check_health)
-    except Exception:
+    The server is forked from this process (no uv/fastmcp CLI round trip), with
+    output going to CLAUDY_DIR/server.log. By default it listens on a Unix socket
+    in CLAUDY_DIR; pass http=True to serve HTTP over TCP on DEFAULT_PORT instead
+    (e.g. for remote access).
+    """
+    # Start from a clean slate so clients don't pick up a stale transport
+    clear_server_info()
+    ensure_claudy_dir()
+
+    # Unix sockets need AF_UNIX, and only the fork path serves them reliably;
+    # elsewhere (e.g. Windows) fall back to HTTP over TCP
+    if not hasattr(os, "fork") or not hasattr(socket, "AF_UNIX"):
+        http = True
+
+    if hasattr(os, "fork"):
+        pid = _fork_server(http)
+        has_exited = partial(_child_exited, pid)
+    else:
+        process = _spawn_server_process(http)
+        pid = process.pid
+        has_exited = partial(_process_exited, process)
+
+    # Save PID (and PORT when serving over TCP)
+    save_server_pid(pid)
+    if http:
+        save_server_port(DEFAULT_PORT)
+
+    # Wait until the server accepts connections instead of a fixed sleep
+    address = (DEFAULT_HOST, DEFAULT_PORT) if http else str(SOCKET_FILE)
+    if not _wait_for_server(address, SERVER_STARTUP_TIMEOUT, has_exited):
         return False
 
+    # Check if it's running - try to connect with FastMCP Client
+    async def check_health():
+        try:
+            client = await _get_client()
+            # Try to list tools as a health check
+            await client.list_tools()
+            return True
+        except Exception:
+            await _close_client()
+            return False
+
+    healthy = _run(check_health())
+    if healthy:
+        mark_server_alive()
+    return healthy
+
 
 def stop_server():
     """Stop the agent server."""
     pid = get_server_pid()
 
     if not pid:
-        print(
-            json.dumps(
-                {
-                    "success": False,
-                    "error": "Server is not running",
-                    "error_code": "SERVER_NOT_RUNNING",
-                },
-                ensure_ascii=False,
-            )
-        )
+        print(_ERR_SERVER_NOT_RUNNING)
         sys.exit(1)
 
     try:
-        os.kill(pid, 15)  # SIGTERM
-        time.sleep(0.5)  # Give it time to shutdown gracefully
-
-        # Check if it's still running
+        pidfd = _open_pidfd(pid)
         try:
-            os.kill(pid, 0)
-            # Still running, force kill
-            os.kill(pid, 9)  # SIGKILL
-        except (OSError, ProcessLookupError):
-            pass  # Already dead
+            _send_signal(pid, pidfd, signal.SIGTERM)
+
+            # Give it time to shutdown gracefully, force kill if still running
+            if not _wait_for_exit(pid, pidfd, 0.5):
+                try:
+                    # SIGKILL doesn't exist on Windows, where SIGTERM already kills
+                    _send_signal(pid, pidfd, getattr(signal, "SIGKILL", signal.SIGTERM))
+                except (OSError, ProcessLookupError):
+                    pass  # Already dead
+                else:
+                    # Make sure it is gone (and its socket/port released) before
+                    # returning, so a restart doesn't race the dying process
+                    _wait_for_exit(pid, pidfd, 5.0)
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
 
         clear_server_info()
-        print(json.dumps({"success": True, "message": "Server stopped"}, ensure_ascii=False))
+        print(_MSG_SERVER_STOPPED)
 
     except (OSError, ProcessLookupError):
         clear_server_info()
-        print(json.dumps({"success": True, "message": "Server was not running"}, ensure_ascii=False))
+        print(_MSG_SERVER_WAS_NOT_RUNNING)
 
 
-def call_tool(tool_name: str, params: dict) -> dict:
-    """Call a FastMCP tool via FastMCP Client."""
-    port = get_server_port() or DEFAULT_PORT
+def _error_result(error: BaseException) -> dict:
+    """Convert a failed tool call into an error result."""
+    if isinstance(error, JSONDecodeError):
+        return {
+            "success": False,
+            "error": f"Invalid JSON response: {str(error)}",
+            "error_code": "JSON_ERROR",
+        }
+    return {
+        "success": False,
+        "error": str(error),
+        "error_code": "UNKNOWN_ERROR",
+    }
+
+
+def call_tools_many(calls: list[tuple[str, dict]]) -> list[dict]:
+    """Call several FastMCP tools concurrently over the shared client.
+
+    Results are returned in the same order as `calls`.
+    """
+    import asyncio
+
+    async def _call_one(client, tool_name: str, params: dict) -> dict:
+        result = await client.call_tool(tool_name, params)
+        # FastMCP tools return JSON strings, need to parse
+        return loads(result.data)
 
     async def _call():
         try:
-            client = Client(f"http://{DEFAULT_HOST}:{port}/mcp")
-            async with client:
-                result = await client.call_tool(tool_name, params)
-                # FastMCP tools return JSON strings, need to parse
-                return json.loads(result.data)
-
-        except json.JSONDecodeError as e:
-            return {
-                "success": False,
-                "error": f"Invalid JSON response: {str(e)}",
-                "error_code": "JSON_ERROR",
-            }
+            client = await _get_client()
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "error_code": "UNKNOWN_ERROR",
-            }
+            return [e] * len(calls)
+
+        return await asyncio.gather(
+            *(_call_one(client, tool_name, params) for tool_name, params in calls),
+            return_exceptions=True,
+        )
+
+    results = _run(_call())
+
+    if any(
+        isinstance(r, BaseException) and not isinstance(r, JSONDecodeError)
+        for r in results
+    ):
+        # Drop the session so the next call reconnects from scratch, and stop
+        # trusting the cached liveness check
+        _run(_close_client())
+        clear_server_alive()
 
-    return anyio.run(_call)
+    return [_error_result(r) if isinstance(r, BaseException) else r for r in results]
+
+
+def call_tool(tool_name: str, params: dict) -> dict:
+    """Call a FastMCP tool via FastMCP Client."""
+    return call_tools_many([(tool_name, params)])[0]
 
 
 def print_output(result: dict, verbosity: str = "normal"):
     """Print output based on verbosity level and result type."""
     if not result.get("success"):
         # Always print errors as JSON
-        print(json.dumps(result, ensure_ascii=False))
+        print(dumps(result))
         return
 
     # For successful operations, format based on verbosity
-    if verbosity == "quiet":
-        # Only print the response text
+    if verbosity == VERBOSITY_QUIET:
+        # Only print the response text (the server already trimmed the payload)
         if "response" in result:
             print(result["response"])
     else:
         # Print full JSON
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        print(dumps(result, indent=True))
+
+
+def run_mcp_proxy():
+    """Run the stdio MCP proxy, starting the daemon first if needed."""
+    # Try to start server if not running (silent)
+    if not is_server_running():
+        start_server()
+        # The proxy opens its own client, don't keep the health check's session open
+        _run(_close_client())
+
+    # Run stdio proxy that forwards to HTTP daemon
+    from .stdio_proxy import run_stdio_proxy
+    _run(run_stdio_proxy())
 
 
 def main():
     """Main CLI entry point."""
+    # Fast paths that skip building the argparse parser: `claudy mcp` is spawned
+    # by Claude Code for every MCP connection and takes no arguments
+    argv = sys.argv[1:]
+    if argv == ["mcp"]:
+        run_mcp_proxy()
+        return
+    if argv == ["--version"]:
+        print(f"claudy {__version__}")
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Claudy - Universal Claude agent manager (FastMCP-based)"
     )
     parser.add_argument(
         "--version",
         action="version",
-        version="claudy 0.1.0",
+        version=f"claudy {__version__}",
     )
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
 
@@ -209,9 +575,9 @@ def main():
 
     # Status command
     status_parser = subparsers.add_parser(
-        "status", help="Get status of a specific session"
+        "status", help="Get status of one or more sessions"
     )
-    status_parser.add_argument("name", help="Session name")
+    status_parser.add_argument("names", nargs="+", metavar="name", help="Session name(s)")
 
     # Cleanup command
     cleanup_parser = subparsers.add_parser("cleanup", help="Cleanup one or all sessions")
@@ -225,6 +591,11 @@ def main():
         choices=["start", "stop", "status", "restart"],
         help="Server action",
     )
+    server_parser.add_argument(
+        "--http",
+        action="store_true",
+        help=f"Serve HTTP on port {DEFAULT_PORT} instead of a local Unix socket",
+    )
 
     # MCP server command (for MCP integration)
     mcp_parser = subparsers.add_parser("mcp", help="Start MCP server (for Claude Code)")
@@ -237,35 +608,19 @@ def main():
 
     # Handle MCP command (stdio proxy to HTTP daemon)
     if args.command == "mcp":
-        # Try to start server if not running (silent)
-        if not is_server_running():
-            start_server()
-
-        # Run stdio proxy that forwards to HTTP daemon
-        from .stdio_proxy import run_stdio_proxy
-        asyncio.run(run_stdio_proxy())
+        run_mcp_proxy()
         return
 
     # Handle server management commands
     if args.command == "server":
         if args.action == "start":
             if is_server_running():
-                print(
-                    json.dumps(
-                        {"success": True, "message": "Server is already running"},
-                        ensure_ascii=False,
-                    )
-                )
+                print(_MSG_SERVER_ALREADY_RUNNING)
             else:
-                if start_server():
-                    print(json.dumps({"success": True, "message": "Server started"}, ensure_ascii=False))
+                if start_server(http=args.http):
+                    print(_MSG_SERVER_STARTED)
                 else:
-                    print(
-                        json.dumps(
-                            {"success": False, "error": "Failed to start server"},
-                            ensure_ascii=False,
-                        )
-                    )
+                    print(_ERR_SERVER_START)
                     sys.exit(1)
         elif args.action == "stop":
             stop_server()
@@ -273,42 +628,25 @@ def main():
             if is_server_running():
                 port = get_server_port()
                 pid = get_server_pid()
-                print(
-                    json.dumps(
-                        {"success": True, "running": True, "port": port, "pid": pid},
-                        ensure_ascii=False,
-                    )
-                )
+                status = {"success": True, "running": True, "port": port, "pid": pid}
+                if SOCKET_FILE.exists():
+                    status["socket"] = str(SOCKET_FILE)
+                print(dumps(status))
             else:
-                print(json.dumps({"success": True, "running": False}, ensure_ascii=False))
+                print(_MSG_SERVER_NOT_RUNNING)
         elif args.action == "restart":
             if is_server_running():
                 stop_server()
-                time.sleep(1)
-            if start_server():
-                print(json.dumps({"success": True, "message": "Server restarted"}, ensure_ascii=False))
+            if start_server(http=args.http):
+                print(_MSG_SERVER_RESTARTED)
             else:
-                print(
-                    json.dumps(
-                        {"success": False, "error": "Failed to restart server"},
-                        ensure_ascii=False,
-                    )
-                )
+                print(_ERR_SERVER_RESTART)
                 sys.exit(1)
         sys.exit(0)
 
     # For all other commands, check if server is running
     if not is_server_running():
-        print(
-            json.dumps(
-                {
-                    "success": False,
-                    "error": "Server is not running. Start it with: claudy server start",
-                    "error_code": "SERVER_NOT_RUNNING",
-                },
-                ensure_ascii=False,
-            )
-        )
+        print(_ERR_SERVER_NOT_STARTED)
         sys.exit(1)
 
     # Execute command
@@ -332,7 +670,17 @@ def main():
             print_output(result)
 
         elif args.command == "status":
-            result = call_tool("claudy_status", {"name": args.name})
+            if len(args.names) == 1:
+                result = call_tool("claudy_status", {"name": args.names[0]})
+            else:
+                # Query all sessions concurrently over one connection
+                results = call_tools_many(
+                    [("claudy_status", {"name": name}) for name in args.names]
+                )
+                result = {
+                    "success": all(r.get("success") for r in results),
+                    "results": dict(zip(args.names, results)),
+                }
             print_output(result)
 
         elif args.command == "cleanup":
@@ -341,15 +689,7 @@ def main():
             elif args.name:
                 result = call_tool("claudy_cleanup", {"name": args.name})
             else:
-                print(
-                    json.dumps(
-                        {
-                            "success": False,
-                            "error": "Either provide a session name or use --all",
-                        },
-                        ensure_ascii=False,
-                    )
-                )
+                print(_ERR_CLEANUP_ARGS)
                 sys.exit(1)
             print_output(result)
 
@@ -357,26 +697,16 @@ def main():
         sys.exit(0 if result.get("success") else 1)
 
     except KeyboardInterrupt:
-        print(
-            json.dumps(
-                {
-                    "success": False,
-                    "error": "Interrupted by user",
-                    "error_code": "INTERRUPTED",
-                },
-                ensure_ascii=False,
-            )
-        )
+        print(_ERR_INTERRUPTED)
         sys.exit(1)
     except Exception as e:
         print(
-            json.dumps(
+            dumps(
                 {
                     "success": False,
                     "error": str(e),
                     "error_code": "UNKNOWN_ERROR",
                 },
-                ensure_ascii=False,
             )
         )
         sys.exit(1)
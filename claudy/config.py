@@ -1,23 +1,39 @@
 """Configuration for Claudy."""
 
+import os
+import time
 from pathlib import Path
 
 # Server configuration
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 8000
 SERVER_TIMEOUT = 120  # seconds
+SERVER_STARTUP_TIMEOUT = 10  # seconds to wait for the server to accept connections
+SERVER_ALIVE_TTL_NS = 500_000_000  # trust a successful liveness check for 500ms
+
+# HTTP connection pool (client) and keep-alive (server) configuration
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_KEEPALIVE_EXPIRY = 60  # seconds an idle client connection is kept for reuse
+SERVER_KEEPALIVE_TIMEOUT = HTTP_KEEPALIVE_EXPIRY + 5  # outlive the client so it never reuses a closed one
 
 # Session management configuration
 SESSION_IDLE_TIMEOUT = 1200  # 20 minutes in seconds
-SESSION_CLEANUP_INTERVAL = 300  # Check every 5 minutes
+MAX_BACKGROUND_TASKS = 256  # claudy_call_async tasks held until collected (running or finished)
 
 # Port file location
 CLAUDY_DIR = Path.home() / ".claudy"
 PORT_FILE = CLAUDY_DIR / "server.port"
 PID_FILE = CLAUDY_DIR / "server.pid"
+SOCKET_FILE = CLAUDY_DIR / "mcp.sock"
+LOG_FILE = CLAUDY_DIR / "server.log"
+ALIVE_FILE = CLAUDY_DIR / "alive.ts"
 
-# Ensure .claudy directory exists
-CLAUDY_DIR.mkdir(exist_ok=True)
+# Precomputed string paths for the hot read path (skips Path.__fspath__ dispatch)
+_PORT_FILE_STR = str(PORT_FILE)
+_PID_FILE_STR = str(PID_FILE)
+_SOCKET_FILE_STR = str(SOCKET_FILE)
+_ALIVE_FILE_STR = str(ALIVE_FILE)
 
 # Output verbosity levels
 VERBOSITY_QUIET = "quiet"      # Only final text response
@@ -25,46 +41,112 @@ VERBOSITY_NORMAL = "normal"    # Final response + basic info
 VERBOSITY_VERBOSE = "verbose"  # Everything including thinking and tool calls
 
 
+# Parsed file contents keyed by path: (mtime_ns, value)
+_int_file_cache: dict[str, tuple[int, int | None]] = {}
+
+
+def ensure_claudy_dir() -> None:
+    """Create the .claudy directory if needed (deferred until something is written)."""
+    CLAUDY_DIR.mkdir(exist_ok=True)
+
+
 # Helper functions for file I/O
-def _read_int_from_file(file_path: Path) -> int | None:
-    """Read an integer value from a file."""
+def _read_int_from_file(file_path: str) -> int | None:
+    """Read an integer value from a file, re-reading only when its mtime changes."""
     try:
-        if file_path.exists():
-            return int(file_path.read_text().strip())
-    except (ValueError, IOError):
-        pass
-    return None
+        mtime = os.stat(file_path).st_mtime_ns
+    except OSError:
+        _int_file_cache.pop(file_path, None)
+        return None
 
+    cached = _int_file_cache.get(file_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
 
-def _write_int_to_file(file_path: Path, value: int) -> None:
+    # Raw fd I/O: int() parses the bytes directly, no text layer or codec lookup
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        value = int(os.read(fd, 32))
+    except (ValueError, OSError):
+        value = None
+    finally:
+        os.close(fd)
+
+    _int_file_cache[file_path] = (mtime, value)
+    return value
+
+
+def _write_int_to_file(file_path: str, value: int) -> None:
     """Write an integer value to a file."""
-    file_path.write_text(str(value))
+    ensure_claudy_dir()
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, b"%d" % value)
+    finally:
+        os.close(fd)
+    # mtime may not change on coarse-grained filesystems, drop the cached value
+    _int_file_cache.pop(file_path, None)
 
 
 # Public API
 def get_server_port() -> int | None:
     """Read the server port from the port file."""
-    return _read_int_from_file(PORT_FILE)
+    return _read_int_from_file(_PORT_FILE_STR)
 
 
 def save_server_port(port: int) -> None:
     """Save the server port to the port file."""
-    _write_int_to_file(PORT_FILE, port)
+    _write_int_to_file(_PORT_FILE_STR, port)
 
 
 def get_server_pid() -> int | None:
     """Read the server PID from the PID file."""
-    return _read_int_from_file(PID_FILE)
+    return _read_int_from_file(_PID_FILE_STR)
 
 
 def save_server_pid(pid: int) -> None:
     """Save the server PID to the PID file."""
-    _write_int_to_file(PID_FILE, pid)
+    _write_int_to_file(_PID_FILE_STR, pid)
+
+
+def mark_server_alive() -> None:
+    """Record that the server was just confirmed alive (touches the sentinel file)."""
+    try:
+        os.utime(_ALIVE_FILE_STR)
+    except FileNotFoundError:
+        try:
+            os.close(os.open(_ALIVE_FILE_STR, os.O_WRONLY | os.O_CREAT, 0o644))
+        except OSError:
+            pass  # Best effort, the next check just falls back to the slow path
+    except OSError:
+        pass
+
+
+def is_server_recently_alive() -> bool:
+    """Check whether the server was confirmed alive within SERVER_ALIVE_TTL_NS."""
+    try:
+        mtime = os.stat(_ALIVE_FILE_STR).st_mtime_ns
+    except OSError:
+        return False
+    return time.time_ns() - mtime < SERVER_ALIVE_TTL_NS
+
+
+def clear_server_alive() -> None:
+    """Forget a previous liveness confirmation."""
+    try:
+        os.unlink(_ALIVE_FILE_STR)
+    except FileNotFoundError:
+        pass
 
 
 def clear_server_info() -> None:
-    """Clear server port and PID files."""
-    if PORT_FILE.exists():
-        PORT_FILE.unlink()
-    if PID_FILE.exists():
-        PID_FILE.unlink()
+    """Clear server port, PID, socket and liveness files."""
+    _int_file_cache.clear()
+    for file_path in (_PORT_FILE_STR, _PID_FILE_STR, _SOCKET_FILE_STR, _ALIVE_FILE_STR):
+        try:
+            os.unlink(file_path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,50 @@
+"""JSON helpers that use orjson when installed, falling back to the stdlib."""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup (pip install claudy[fast])
+    orjson = None
+
+
+def _default(obj):
+    """Serialize objects the stdlib encoder doesn't know (orjson handles these natively)."""
+    import dataclasses
+
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj, indent: bool = False) -> str:
+    """Serialize obj to a JSON string (non-ASCII characters are kept as-is).
+
+    Output is compact by default, which matches what orjson produces and keeps
+    the stdlib fallback on its C encoder; indent=True uses two-space indentation.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_default)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_default)
+
+
+def dumps_bytes(obj) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes, for writing straight to a stream."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), default=_default
+    ).encode()
+
+
+def loads(data: str | bytes):
+    """Deserialize a JSON document from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
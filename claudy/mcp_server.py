@@ -2,21 +2,78 @@
 """FastMCP-based Claudy server for managing Claude agent sessions."""
 
 import asyncio
-import json
+import functools
+import heapq
+import inspect
+import io
 import os
+import sys
+import time
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions
-from claude_agent_sdk.types import TextBlock
-from fastmcp import FastMCP
+from claude_agent_sdk.types import TextBlock, ThinkingBlock, ToolResultBlock, ToolUseBlock
+from fastmcp import Context, FastMCP
 
 try:
-    from .config import SESSION_IDLE_TIMEOUT, SESSION_CLEANUP_INTERVAL
+    from .config import (
+        MAX_BACKGROUND_TASKS,
+        SERVER_KEEPALIVE_TIMEOUT,
+        SESSION_IDLE_TIMEOUT,
+    )
+    from .json_utils import dumps
 except ImportError:
-    from claudy.config import SESSION_IDLE_TIMEOUT, SESSION_CLEANUP_INTERVAL
+    from claudy.config import (
+        MAX_BACKGROUND_TASKS,
+        SERVER_KEEPALIVE_TIMEOUT,
+        SESSION_IDLE_TIMEOUT,
+    )
+    from claudy.json_utils import dumps
+
+# Verbose-mode content blocks. A long agent turn produces many of these, so they
+# are slotted dataclasses rather than dicts; json_utils serializes them directly.
+@dataclass(slots=True)
+class BlockEvent:
+    type: str
+
+
+@dataclass(slots=True)
+class TextEvent:
+    type: str
+    text: str
+
+
+@dataclass(slots=True)
+class ThinkingEvent:
+    type: str
+    thinking: str
+
+
+@dataclass(slots=True)
+class ToolUseEvent:
+    type: str
+    name: str
+    input: Any
+
+
+@dataclass(slots=True)
+class ToolResultEvent:
+    type: str
+    tool_use_id: str
+    content: Any
+
+
+# Event builders by SDK block type (other block types only record their type)
+_BLOCK_EVENTS: Dict[type, Callable[[Any], Any]] = {
+    TextBlock: lambda b: TextEvent("TextBlock", b.text),
+    ThinkingBlock: lambda b: ThinkingEvent("ThinkingBlock", b.thinking),
+    ToolUseBlock: lambda b: ToolUseEvent("ToolUseBlock", b.name, b.input),
+    ToolResultBlock: lambda b: ToolResultEvent("ToolResultBlock", b.tool_use_id, b.content),
+}
 
 
 def get_current_claude_session_id() -> Optional[str]:
@@ -26,14 +83,19 @@ def get_current_claude_session_id() -> Optional[str]:
         project_name = cwd.replace('/', '-')
         sessions_dir = Path.home() / ".claude" / "projects" / project_name
 
-        if sessions_dir.exists():
-            jsonl_files = sorted(
-                sessions_dir.glob("*.jsonl"),
-                key=lambda x: x.stat().st_mtime,
-                reverse=True
-            )
-            if jsonl_files:
-                return jsonl_files[0].stem  # Filename without extension is the session ID
+        # Single pass for the newest *.jsonl, no Path objects, list or sort
+        newest = None
+        newest_mtime = -1
+        with os.scandir(sessions_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".jsonl"):
+                    mtime = entry.stat().st_mtime_ns
+                    if mtime > newest_mtime:
+                        newest_mtime = mtime
+                        newest = entry.name
+
+        if newest:
+            return newest[:-len(".jsonl")]  # Filename without extension is the session ID
     except Exception:
         pass
     return None
@@ -45,39 +107,120 @@ _global_sessions: Dict[str, tuple[ClaudeSDKClient, dict]] = {}
 
 # Background task storage for async execution
 # Key: session_name, Value: asyncio.Task
+# Tasks stay here, running or finished, until claudy_get_results collects them.
+# Results are never dropped uncollected; instead new tasks are refused once
+# MAX_BACKGROUND_TASKS are held (including superseded ones below).
 _background_tasks: Dict[str, asyncio.Task] = {}
 
+# Still-running tasks replaced by a newer call under the same name. They are
+# not collectable, but still hold a slot until they finish.
+_superseded_tasks: set[asyncio.Task] = set()
+
 # Shared context storage for inter-session communication
 # Key: context_key, Value: list of {session_id, data, timestamp}
 _shared_contexts: Dict[str, list] = {}
 
+# Guard check-then-act sequences on the dicts above that span an await.
+# Never hold these across client I/O (connect/disconnect/query).
+_sessions_lock = asyncio.Lock()
+_tasks_lock = asyncio.Lock()
 
-async def cleanup_idle_sessions():
-    """Background task to cleanup idle sessions."""
-    while True:
-        try:
-            await asyncio.sleep(SESSION_CLEANUP_INTERVAL)
+# Min-heap of (expiry, session_name) on the monotonic clock, one entry per touch.
+# Entries go stale when a session is used again or removed; cleanup skips those.
+_expiry_heap: list[tuple[float, str]] = []
 
-            now = datetime.now()
-            to_cleanup = []
+# Wakes the cleanup task when the earliest expiry changes. Shares _sessions_lock,
+# which also guards _expiry_heap.
+_cleanup_cv = asyncio.Condition(_sessions_lock)
 
-            for name, (client, metadata) in _global_sessions.items():
-                last_used = datetime.fromisoformat(metadata["last_used"])
-                idle_seconds = (now - last_used).total_seconds()
 
-                if idle_seconds > SESSION_IDLE_TIMEOUT:
-                    to_cleanup.append(name)
+def _touch_session(name: str, metadata: dict) -> None:
+    """Mark a session as used now and schedule its idle expiry.
 
-            # Cleanup idle sessions
-            for name in to_cleanup:
-                if name in _global_sessions:
-                    client, _ = _global_sessions[name]
-                    try:
-                        await client.disconnect()
-                    except Exception:
-                        pass  # Best effort cleanup
+    Must be called with _sessions_lock held.
+    """
+    now = time.monotonic()
+    metadata["last_used_mono"] = now
+    entry = (now + SESSION_IDLE_TIMEOUT, name)
+    heapq.heappush(_expiry_heap, entry)
+
+    if _expiry_heap[0] is entry:
+        _cleanup_cv.notify()  # New earliest deadline, let the cleanup task recompute
+
+    # Drop stale entries once they clearly outnumber live sessions
+    if len(_expiry_heap) > 4 * len(_global_sessions) + 64:
+        _expiry_heap[:] = [
+            (meta["last_used_mono"] + SESSION_IDLE_TIMEOUT, session_name)
+            for session_name, (_, meta) in _global_sessions.items()
+        ]
+        heapq.heapify(_expiry_heap)
+
+
+def _public_metadata(metadata: dict) -> dict:
+    """Return session metadata for output, with last_used as a wall-clock ISO timestamp.
+
+    Sessions only track last use on the monotonic clock; it is converted here,
+    the one place a human-readable time is needed.
+    """
+    public = {}
+    for key, value in metadata.items():
+        if key == "last_used_mono":
+            wall_time = time.time() - (time.monotonic() - value)
+            key, value = "last_used", datetime.fromtimestamp(wall_time).isoformat()
+        public[key] = value
+    return public
+
+
+async def _safe_disconnect(client: ClaudeSDKClient) -> None:
+    """Disconnect a client, ignoring errors (best effort cleanup)."""
+    try:
+        await client.disconnect()
+    except Exception:
+        pass
+
+
+async def _disconnect_all(clients: list[ClaudeSDKClient]) -> None:
+    """Disconnect clients concurrently; each one stops its own CLI subprocess."""
+    await asyncio.gather(*(_safe_disconnect(client) for client in clients))
+
+
+async def cleanup_idle_sessions():
+    """Background task to cleanup idle sessions.
+
+    Sleeps until the earliest session expiry, or until _touch_session reports a
+    new earliest one, instead of polling.
+    """
+    while True:
+        try:
+            to_disconnect = []
+
+            # Pick and remove idle sessions atomically, disconnect outside the lock
+            async with _cleanup_cv:
+                if not _expiry_heap:
+                    await _cleanup_cv.wait()
+                else:
+                    delay = _expiry_heap[0][0] - time.monotonic()
+                    if delay > 0:
+                        try:
+                            await asyncio.wait_for(_cleanup_cv.wait(), timeout=delay)
+                        except asyncio.TimeoutError:
+                            pass
+
+                now = time.monotonic()
+                while _expiry_heap and _expiry_heap[0][0] <= now:
+                    _, name = heapq.heappop(_expiry_heap)
+                    session = _global_sessions.get(name)
+                    if session is None:
+                        continue  # Already removed
+                    client, metadata = session
+                    if now - metadata["last_used_mono"] < SESSION_IDLE_TIMEOUT:
+                        continue  # Used again since, a later entry covers it
+                    to_disconnect.append(client)
                     del _global_sessions[name]
 
+            # Cleanup idle sessions
+            await _disconnect_all(to_disconnect)
+
         except Exception:
             pass  # Don't let background task crash
 
@@ -100,22 +243,33 @@ async def lifespan(_: FastMCP):
         except Exception:
             pass  # Log unexpected errors but don't crash shutdown
 
-        # Disconnect all sessions with timeout protection
-        disconnect_tasks = []
-        for client, _ in list(_global_sessions.values()):
-            disconnect_tasks.append(asyncio.create_task(client.disconnect()))
-
-        if disconnect_tasks:
+        # Stop background calls so no task is left pending at exit
+        background = [*_background_tasks.values(), *_superseded_tasks]
+        for task in background:
+            task.cancel()
+        if background:
             try:
                 await asyncio.wait_for(
-                    asyncio.gather(*disconnect_tasks, return_exceptions=True),
-                    timeout=5.0
+                    asyncio.gather(*background, return_exceptions=True),
+                    timeout=2.0
                 )
+            except asyncio.TimeoutError:
+                pass
+
+        # Disconnect all sessions with timeout protection
+        async with _sessions_lock:
+            clients = [client for client, _ in _global_sessions.values()]
+            _global_sessions.clear()
+
+        if clients:
+            try:
+                await asyncio.wait_for(_disconnect_all(clients), timeout=5.0)
             except asyncio.TimeoutError:
                 pass  # Some clients didn't disconnect in time, continue anyway
 
         _global_sessions.clear()
         _background_tasks.clear()
+        _superseded_tasks.clear()
         _shared_contexts.clear()
 
 
@@ -159,13 +313,13 @@ async def get_or_create_session(
     parent_session_id: Optional[str] = None
 ) -> tuple[ClaudeSDKClient, dict]:
     """Get existing session or create new one with auto-spawn."""
-    if name in _global_sessions:
-        client, metadata = _global_sessions[name]
-        # Update last_used
-        metadata["last_used"] = datetime.now().isoformat()
-        return client, metadata
+    async with _sessions_lock:
+        if name in _global_sessions:
+            client, metadata = _global_sessions[name]
+            _touch_session(name, metadata)
+            return client, metadata
 
-    # Auto-spawn new session
+    # Auto-spawn new session (connect outside the lock, it spawns a subprocess)
     options = ClaudeAgentOptions()
     options.permission_mode = "bypassPermissions"
 
@@ -188,7 +342,7 @@ async def get_or_create_session(
 
     metadata = {
         "created_at": datetime.now().isoformat(),
-        "last_used": datetime.now().isoformat(),
+        "last_used_mono": time.monotonic(),
         "message_count": 0,
         "session_id": None,
         "auto_created": True,
@@ -196,8 +350,21 @@ async def get_or_create_session(
     if parent_session_id:
         metadata["parent_session_id"] = parent_session_id
 
-    _global_sessions[name] = (client, metadata)
-    return client, metadata
+    async with _sessions_lock:
+        existing = _global_sessions.get(name)
+        if existing is None:
+            _global_sessions[name] = (client, metadata)
+            _touch_session(name, metadata)
+            return client, metadata
+        # A concurrent call created the same session while we were connecting
+        _touch_session(name, existing[1])
+
+    # Keep theirs and drop ours instead of leaking a connected client
+    try:
+        await client.disconnect()
+    except Exception:
+        pass
+    return existing
 
 
 async def _execute_call(
@@ -208,8 +375,12 @@ async def _execute_call(
     fork_name: Optional[str] = None,
     parent_session_id: Optional[str] = None,
     timeout: int = 300,  # 5 minutes default timeout
+    on_text: Optional[Callable[[str], Awaitable[None]]] = None,
 ) -> dict:
-    """Internal helper to execute a call (used by both sync and async versions)."""
+    """Internal helper to execute a call (used by both sync and async versions).
+
+    on_text, if given, is awaited with each message's response text as it arrives.
+    """
     try:
         # Note: parent_session_id is only used when explicitly provided
         # Auto-detection disabled to prevent context leakage
@@ -252,11 +423,14 @@ async def _execute_call(
             timeout=30  # 30 seconds for session creation
         )
 
+        verbose = verbosity == "verbose"
+
         # Send message and collect response (with timeout)
         async def _send_and_receive():
             await client.query(message)
 
-            response_parts = []
+            response = io.StringIO()
+            has_text = False
             all_events = []
             session_id = None
 
@@ -267,28 +441,30 @@ async def _execute_call(
                     if metadata["session_id"] is None:
                         metadata["session_id"] = session_id
 
-                # Collect all events for verbose mode
-                if verbosity == "verbose":
+                content = getattr(msg, "content", None)
+                texts = ()
+
+                if not verbose:
+                    # Collect text for response
+                    if content is not None:
+                        texts = [block.text for block in content if isinstance(block, TextBlock)]
+                else:
+                    # Collect all events (and the response text) for verbose mode
                     msg_dict = {"type": type(msg).__name__}
 
-                    if hasattr(msg, "content"):
-                        msg_dict["content"] = []
-                        for block in msg.content:
-                            block_dict = {"type": getattr(block, "type", type(block).__name__)}
+                    if content is not None:
+                        texts = []
+                        blocks = []
+                        for block in content:
+                            block_type = type(block)
+                            make_event = _BLOCK_EVENTS.get(block_type)
+                            blocks.append(
+                                make_event(block) if make_event else BlockEvent(block_type.__name__)
+                            )
 
                             if isinstance(block, TextBlock):
-                                block_dict["text"] = block.text
-                            elif hasattr(block, "thinking"):
-                                block_dict["thinking"] = block.thinking
-                            elif hasattr(block, "name") and hasattr(block, "input"):
-                                block_dict["name"] = block.name
-                                block_dict["input"] = block.input
-                            elif hasattr(block, "tool_use_id"):
-                                block_dict["tool_use_id"] = block.tool_use_id
-                                if hasattr(block, "content"):
-                                    block_dict["content"] = block.content
-
-                            msg_dict["content"].append(block_dict)
+                                texts.append(block.text)
+                        msg_dict["content"] = blocks
 
                     if hasattr(msg, "stop_reason"):
                         msg_dict["stop_reason"] = msg.stop_reason
@@ -297,29 +473,39 @@ async def _execute_call(
 
                     all_events.append(msg_dict)
 
-                # Collect text for response
-                if hasattr(msg, "content"):
-                    for block in msg.content:
-                        if isinstance(block, TextBlock):
-                            response_parts.append(block.text)
+                if texts:
+                    # Append to one buffer instead of keeping every part until the end
+                    chunk = "\n".join(texts)
+                    if has_text:
+                        response.write("\n")
+                    response.write(chunk)
+                    has_text = True
 
-            return response_parts, all_events, session_id
+                    if on_text is not None:
+                        await on_text(chunk)
+
+            return response.getvalue(), all_events, session_id
 
         # Execute with timeout
-        response_parts, all_events, session_id = await asyncio.wait_for(
+        response_text, all_events, session_id = await asyncio.wait_for(
             _send_and_receive(),
             timeout=timeout
         )
 
         # Update metadata
-        metadata["last_used"] = datetime.now().isoformat()
-        metadata["message_count"] += 1
+        async with _sessions_lock:
+            _touch_session(name, metadata)
+            metadata["message_count"] += 1
+
+        # Quiet callers only read the response text, skip the rest of the payload
+        if verbosity == "quiet":
+            return {"success": True, "response": response_text}
 
         # Build response based on verbosity
         result = {
             "success": True,
             "name": name,
-            "response": "\n".join(response_parts),
+            "response": response_text,
         }
 
         if session_id:
@@ -328,7 +514,7 @@ async def _execute_call(
         if fork:
             result["forked"] = True
 
-        if verbosity == "verbose":
+        if verbose:
             result["events"] = all_events
 
         return result
@@ -347,7 +533,22 @@ async def _execute_call(
         }
 
 
+def json_tool(fn):
+    """Serialize a tool's returned dict to a JSON string.
+
+    Tools return plain dicts and MCP clients receive JSON text. The wrapper keeps
+    the tool's signature for FastMCP's schema, but declares a str return.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return dumps(await fn(*args, **kwargs))
+
+    wrapper.__signature__ = inspect.signature(fn).replace(return_annotation=str)
+    return wrapper
+
+
 @mcp.tool
+@json_tool
 async def claudy_call(
     name: str,
     message: str,
@@ -356,7 +557,8 @@ async def claudy_call(
     fork_name: Optional[str] = None,
     parent_session_id: Optional[str] = None,
     timeout: int = 300,
-) -> str:
+    ctx: Optional[Context] = None,
+) -> dict:
     """Delegate a task to a persistent Claude agent session (blocking, waits for completion).
 
     Creates a new agent or continues an existing conversation. Sessions maintain full context
@@ -387,19 +589,35 @@ async def claudy_call(
     Returns:
         JSON with 'success', 'response', 'session_id', and optional 'events' (if verbose)
     """
-    result = await _execute_call(name, message, verbosity, fork, fork_name, parent_session_id, timeout)
+    on_text = None
+    if ctx is not None:
+        received = 0
+
+        async def on_text(chunk: str):
+            """Stream response text as progress notifications (if the caller asked for progress)."""
+            nonlocal received
+            if not chunk:
+                return  # Progress must increase
+            received += len(chunk)
+            try:
+                await ctx.report_progress(progress=received, message=chunk)
+            except Exception:
+                pass  # Progress is best effort, the full response is still returned
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return await _execute_call(
+        name, message, verbosity, fork, fork_name, parent_session_id, timeout, on_text
+    )
 
 
 @mcp.tool
+@json_tool
 async def claudy_call_async(
     name: str,
     message: str,
     verbosity: str = "normal",
     parent_session_id: Optional[str] = None,
     timeout: int = 300,
-) -> str:
+) -> dict:
     """Start agent task in background, returns immediately for parallel execution.
 
     This is the NON-BLOCKING version that enables true parallel execution. The task runs
@@ -427,20 +645,49 @@ async def claudy_call_async(
     Returns:
         JSON with 'success', 'name', 'status': 'running'
     """
-    # Create background task
-    task = asyncio.create_task(_execute_call(name, message, verbosity, parent_session_id=parent_session_id, timeout=timeout))
-    _background_tasks[name] = task
+    async with _tasks_lock:
+        previous = _background_tasks.get(name)
+        previous_running = previous is not None and not previous.done()
+
+        # A finished previous result is replaced, a running one keeps its slot
+        held = len(_background_tasks) + len(_superseded_tasks)
+        if previous is not None and not previous_running:
+            held -= 1
+        if held >= MAX_BACKGROUND_TASKS:
+            return {
+                "success": False,
+                "error": f"Too many uncollected background tasks ({MAX_BACKGROUND_TASKS}), "
+                         "collect results with claudy_get_results before starting more"
+            }
+
+        # Don't cancel a superseded call mid-response (that would leave its output
+        # queued on the session), but keep counting it until it finishes
+        if previous_running:
+            _superseded_tasks.add(previous)
+            previous.add_done_callback(_superseded_tasks.discard)
 
-    return json.dumps({
+        # Create background task
+        task = asyncio.create_task(_execute_call(name, message, verbosity, parent_session_id=parent_session_id, timeout=timeout))
+        _background_tasks[name] = task
+
+    return {
         "success": True,
         "name": name,
         "status": "running",
         "message": f"Task '{name}' started in background"
-    }, indent=2, ensure_ascii=False)
+    }
+
+
+async def _forget_task(name: str, task: asyncio.Task) -> None:
+    """Remove a collected task, unless it was replaced by a newer one meanwhile."""
+    async with _tasks_lock:
+        if _background_tasks.get(name) is task:
+            del _background_tasks[name]
 
 
 @mcp.tool
-async def claudy_get_results(names: list[str], timeout: Optional[int] = None) -> str:
+@json_tool
+async def claudy_get_results(names: list[str], timeout: Optional[int] = None) -> dict:
     """Wait for and aggregate results from multiple background agents (blocking until complete).
 
     This is the FAN-IN operation that collects results from agents started with claudy_call_async.
@@ -463,7 +710,8 @@ async def claudy_get_results(names: list[str], timeout: Optional[int] = None) ->
 
     Args:
         names: List of session names to wait for and collect
-        timeout: Optional timeout in seconds (default: wait forever)
+        timeout: Optional timeout in seconds for the whole batch (default: wait forever).
+            Tasks still running when it expires are reported as timed out and keep running
 
     Returns:
         JSON with aggregated results from all agents:
@@ -478,47 +726,52 @@ async def claudy_get_results(names: list[str], timeout: Optional[int] = None) ->
     """
     results = {}
 
-    for name in names:
-        if name not in _background_tasks:
-            results[name] = {"success": False, "error": f"No background task found for '{name}'"}
-            continue
-
-        try:
-            # Wait for task to complete (with optional timeout)
-            if timeout:
-                result = await asyncio.wait_for(_background_tasks[name], timeout=timeout)
-            else:
-                result = await _background_tasks[name]
-
-            results[name] = result
+    async with _tasks_lock:
+        tasks = {name: _background_tasks.get(name) for name in names}
 
-            # Cleanup completed task
-            del _background_tasks[name]
+    running = {task for task in tasks.values() if task is not None}
+    if running:
+        # One deadline for the whole batch; whatever is still running then is
+        # reported as timed out and left running so it can be collected later
+        await asyncio.wait(running, timeout=timeout or None)
 
-        except asyncio.TimeoutError:
+    for name, task in tasks.items():
+        if task is None:
+            results[name] = {"success": False, "error": f"No background task found for '{name}'"}
+        elif not task.done():
             results[name] = {
                 "success": False,
                 "error": f"Task '{name}' timed out after {timeout} seconds",
                 "status": "timeout"
             }
-        except Exception as e:
-            results[name] = {
-                "success": False,
-                "error": f"Task '{name}' failed: {str(e)}",
-                "status": "error"
-            }
-            # Cleanup failed task
-            if name in _background_tasks:
-                del _background_tasks[name]
+        else:
+            if task.cancelled():
+                results[name] = {
+                    "success": False,
+                    "error": f"Task '{name}' was cancelled",
+                    "status": "error"
+                }
+            elif task.exception() is not None:
+                results[name] = {
+                    "success": False,
+                    "error": f"Task '{name}' failed: {str(task.exception())}",
+                    "status": "error"
+                }
+            else:
+                results[name] = task.result()
 
-    return json.dumps({
+            # Cleanup collected task
+            await _forget_task(name, task)
+
+    return {
         "success": True,
         "results": results
-    }, indent=2, ensure_ascii=False)
+    }
 
 
 @mcp.tool
-async def claudy_check_status(names: Optional[list[str]] = None) -> str:
+@json_tool
+async def claudy_check_status(names: Optional[list[str]] = None) -> dict:
     """Check if background tasks are still running.
 
     Useful for monitoring long-running tasks without blocking. Returns status of
@@ -538,73 +791,66 @@ async def claudy_check_status(names: Optional[list[str]] = None) -> str:
             }
         }
     """
-    if names is None:
-        names = list(_background_tasks.keys())
+    async with _tasks_lock:
+        if names is None:
+            names = list(_background_tasks.keys())
+        tasks = {name: _background_tasks.get(name) for name in names}
 
     tasks_status = {}
 
-    for name in names:
-        if name not in _background_tasks:
+    for name, task in tasks.items():
+        if task is None:
             tasks_status[name] = "not_found"
-        elif _background_tasks[name].done():
+        elif task.done():
             tasks_status[name] = "completed"
         else:
             tasks_status[name] = "running"
 
-    return json.dumps({
+    return {
         "success": True,
         "tasks": tasks_status
-    }, indent=2, ensure_ascii=False)
+    }
 
 
 @mcp.tool
-async def claudy_list() -> str:
+@json_tool
+async def claudy_list() -> dict:
     """List all active agent sessions with their metadata."""
     sessions_list = [
-        {"name": name, **metadata}
+        {"name": name, **_public_metadata(metadata)}
         for name, (_, metadata) in _global_sessions.items()
     ]
 
-    return json.dumps(
-        {"success": True, "sessions": sessions_list},
-        indent=2,
-        ensure_ascii=False
-    )
+    return {"success": True, "sessions": sessions_list}
 
 
 @mcp.tool
-async def claudy_status(name: str) -> str:
+@json_tool
+async def claudy_status(name: str) -> dict:
     """Get detailed status of a specific agent session.
 
     Args:
         name: Session name to check status
     """
     if name not in _global_sessions:
-        return json.dumps(
-            {
-                "success": False,
-                "error": f"Session '{name}' not found",
-                "available_sessions": list(_global_sessions.keys()),
-            },
-            indent=2,
-            ensure_ascii=False
-        )
+        return {
+            "success": False,
+            "error": f"Session '{name}' not found",
+            "available_sessions": list(_global_sessions.keys()),
+        }
 
     _, metadata = _global_sessions[name]
 
-    return json.dumps(
-        {"success": True, "name": name, **metadata},
-        indent=2,
-        ensure_ascii=False
-    )
+    return {"success": True, "name": name, **_public_metadata(metadata)}
 
 
 @mcp.tool
+@json_tool
 async def claudy_share_context(
     session_name: str,
     context_key: str,
     context_data: dict
-) -> str:
+) -> dict:
     """Share context from one session that other sessions can access.
 
     This enables inter-session communication where specialized agents can share their
@@ -630,10 +876,10 @@ async def claudy_share_context(
         JSON with success status and context_id
     """
     if session_name not in _global_sessions:
-        return json.dumps({
+        return {
             "success": False,
             "error": f"Session '{session_name}' not found"
-        }, indent=2, ensure_ascii=False)
+        }
 
     _, metadata = _global_sessions[session_name]
 
@@ -650,19 +896,20 @@ async def claudy_share_context(
     }
     _shared_contexts[context_key].append(context_entry)
 
-    return json.dumps({
+    return {
         "success": True,
         "context_key": context_key,
         "session_name": session_name,
         "message": f"Context '{context_key}' shared from session '{session_name}'"
-    }, indent=2, ensure_ascii=False)
+    }
 
 
 @mcp.tool
+@json_tool
 async def claudy_get_shared_context(
     context_key: str,
     source_session: Optional[str] = None
-) -> str:
+) -> dict:
     """Retrieve shared context from other sessions.
 
     Access context data that other sessions have shared. Optionally filter by source session.
@@ -689,11 +936,11 @@ async def claudy_get_shared_context(
         - timestamp: When it was shared
     """
     if context_key not in _shared_contexts:
-        return json.dumps({
+        return {
             "success": True,
             "contexts": [],
             "message": f"No contexts found for key '{context_key}'"
-        }, indent=2, ensure_ascii=False)
+        }
 
     contexts = _shared_contexts[context_key]
 
@@ -701,16 +948,17 @@ async def claudy_get_shared_context(
     if source_session:
         contexts = [c for c in contexts if c["session_name"] == source_session]
 
-    return json.dumps({
+    return {
         "success": True,
         "context_key": context_key,
         "count": len(contexts),
         "contexts": contexts
-    }, indent=2, ensure_ascii=False)
+    }
 
 
 @mcp.tool
-async def claudy_cleanup(name: Optional[str] = None, all: bool = False) -> str:
+@json_tool
+async def claudy_cleanup(name: Optional[str] = None, all: bool = False) -> dict:
     """Cleanup one or all agent sessions. Use this when done with agents.
 
     Args:
@@ -719,58 +967,49 @@ async def claudy_cleanup(name: Optional[str] = None, all: bool = False) -> str:
     """
     if all:
         # Cleanup all sessions
-        count = len(_global_sessions)
-        for client, _ in list(_global_sessions.values()):
-            try:
-                await client.disconnect()
-            except Exception:
-                pass
-        _global_sessions.clear()
+        async with _sessions_lock:
+            clients = [client for client, _ in _global_sessions.values()]
+            _global_sessions.clear()
 
-        return json.dumps(
-            {"success": True, "message": f"Cleaned up {count} session(s)"},
-            indent=2,
-            ensure_ascii=False
-        )
+        count = len(clients)
+        await _disconnect_all(clients)
+
+        return {"success": True, "message": f"Cleaned up {count} session(s)"}
     else:
         if not name:
-            return json.dumps(
-                {"success": False, "error": "Session name is required"},
-                indent=2,
-                ensure_ascii=False
-            )
-
-        if name not in _global_sessions:
-            return json.dumps(
-                {
-                    "success": False,
-                    "error": f"Session '{name}' not found",
-                    "available_sessions": list(_global_sessions.keys()),
-                },
-                indent=2,
-                ensure_ascii=False
-            )
+            return {"success": False, "error": "Session name is required"}
+
+        async with _sessions_lock:
+            session = _global_sessions.pop(name, None)
+
+        if session is None:
+            return {
+                "success": False,
+                "error": f"Session '{name}' not found",
+                "available_sessions": list(_global_sessions.keys()),
+            }
 
         # Cleanup single session
-        client, _ = _global_sessions[name]
+        client, _ = session
         try:
             await client.disconnect()
         except Exception:
             pass
 
-        del _global_sessions[name]
-
-        return json.dumps(
-            {
-                "success": True,
-                "name": name,
-                "message": f"Session '{name}' cleaned up successfully",
-            },
-            indent=2,
-            ensure_ascii=False
-        )
+        return {
+            "success": True,
+            "name": name,
+            "message": f"Session '{name}' cleaned up successfully",
+        }
 
 
 if __name__ == "__main__":
-    # Run with FastMCP CLI
-    mcp.run()
+    if len(sys.argv) == 3 and sys.argv[1] == "--uds":
+        # Serve HTTP over a Unix socket (used by `claudy server start`)
+        mcp.run(
+            transport="http",
+            uvicorn_config={"uds": sys.argv[2], "timeout_keep_alive": SERVER_KEEPALIVE_TIMEOUT},
+        )
+    else:
+        # Run with FastMCP CLI
+        mcp.run()
@@ -1,151 +1,311 @@
 #!/usr/bin/env python3
-"""stdio-to-HTTP proxy for MCP integration."""
+"""stdio-to-daemon proxy for MCP integration."""
 
 import asyncio
-import json
+import os
+import stat
 import sys
+from typing import Any
 
 from fastmcp import Client
 
-DEFAULT_HOST = "127.0.0.1"
-DEFAULT_PORT = 8000
+try:
+    from .json_utils import JSONDecodeError, dumps_bytes, loads
+    from .transport import create_client
+except ImportError:
+    from claudy.json_utils import JSONDecodeError, dumps_bytes, loads
+    from claudy.transport import create_client
 
+# Max size of one JSON-RPC line on stdin (asyncio's default is only 64 KiB)
+_STDIN_LINE_LIMIT = 16 * 1024 * 1024
 
-async def _handle_stdio_loop(client: Client):
-    """Handle stdio loop with connected client."""
-    # MCP stdio protocol: read JSON-RPC from stdin, write to stdout
-    while True:
-        try:
-            # Read line from stdin
-            line = await asyncio.get_event_loop().run_in_executor(
-                None, sys.stdin.readline
-            )
+# Static initialize result, serialized once
+_INITIALIZE_RESULT = dumps_bytes({
+    "protocolVersion": "2024-11-05",
+    "capabilities": {
+        "tools": {}
+    },
+    "serverInfo": {
+        "name": "claudy",
+        "version": "0.1.0"
+    }
+})
 
-            if not line:
-                break  # EOF
+# Serialized tools/list result, fetched from the daemon on first request.
+# The daemon's tools are fixed for the lifetime of a proxy.
+_tools_list_result: bytes | None = None
 
-            # Parse JSON-RPC request
-            request = json.loads(line.strip())
+class _FileWriter:
+    """StreamWriter stand-in for a stdout redirected to a regular file."""
 
-            # Handle different MCP methods
-            method = request.get("method")
-            params = request.get("params", {})
-            request_id = request.get("id")
+    def write(self, data: bytes):
+        sys.stdout.buffer.write(data)
 
-            try:
-                if method == "initialize":
-                    # MCP initialization
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {
-                            "protocolVersion": "2024-11-05",
-                            "capabilities": {
-                                "tools": {}
-                            },
-                            "serverInfo": {
-                                "name": "claudy",
-                                "version": "0.1.0"
-                            }
-                        }
-                    }
+    async def drain(self):
+        sys.stdout.buffer.flush()
 
-                elif method == "tools/list":
-                    # List tools from HTTP server
-                    tools = await client.list_tools()
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {
-                            "tools": [
-                                {
-                                    "name": tool.name,
-                                    "description": tool.description,
-                                    "inputSchema": tool.inputSchema
-                                }
-                                for tool in tools
-                            ]
-                        }
-                    }
 
-                elif method == "tools/call":
-                    # Forward tool call to HTTP server
-                    tool_name = params.get("name")
-                    tool_args = params.get("arguments", {})
-
-                    result = await client.call_tool(tool_name, tool_args)
-
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": result.data
-                                }
-                            ]
-                        }
-                    }
+def _is_pollable(fileobj) -> bool:
+    """Whether the event loop can watch this file (pipes, sockets and ttys).
 
-                else:
-                    # Unknown method
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "error": {
-                            "code": -32601,
-                            "message": f"Method not found: {method}"
-                        }
-                    }
+    Other character devices are excluded: epoll rejects e.g. /dev/null, and
+    asyncio reports that from a callback, leaving the stream hanging.
+    """
+    fd = fileobj.fileno()
+    mode = os.fstat(fd).st_mode
+    return stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode) or os.isatty(fd)
 
-            except Exception as e:
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "error": {
-                        "code": -32603,
-                        "message": f"Internal error: {str(e)}"
-                    }
+
+async def _open_stdio() -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Attach asyncio streams to stdin/stdout so the event loop polls them directly.
+
+    Regular files and devices like /dev/null cannot be polled (uvloop aborts on
+    regular files), but they never block either, so they are read up front and
+    written synchronously.
+    """
+    loop = asyncio.get_running_loop()
+
+    reader = asyncio.StreamReader(limit=_STDIN_LINE_LIMIT)
+    if _is_pollable(sys.stdin):
+        protocol = asyncio.StreamReaderProtocol(reader)
+        await loop.connect_read_pipe(lambda: protocol, sys.stdin)
+    else:
+        reader.feed_data(sys.stdin.buffer.read())
+        reader.feed_eof()
+
+    if _is_pollable(sys.stdout):
+        transport, protocol = await loop.connect_write_pipe(
+            asyncio.streams.FlowControlMixin, sys.stdout
+        )
+        writer = asyncio.StreamWriter(transport, protocol, None, loop)
+    else:
+        writer = _FileWriter()
+
+    return reader, writer
+
+
+async def _write_message(
+    writer: asyncio.StreamWriter, message: dict, lock: asyncio.Lock
+):
+    """Write one JSON-RPC message to stdout.
+
+    Requests are handled concurrently, so writes are serialized to keep each
+    message on its own line.
+    """
+    await _write_line(writer, dumps_bytes(message) + b"\n", lock)
+
+
+async def _write_result(
+    writer: asyncio.StreamWriter, request_id, result: bytes, lock: asyncio.Lock
+):
+    """Write a success response around an already serialized result."""
+    data = b'{"jsonrpc":"2.0","id":%s,"result":%s}\n' % (dumps_bytes(request_id), result)
+    await _write_line(writer, data, lock)
+
+
+async def _write_line(writer: asyncio.StreamWriter, data: bytes, lock: asyncio.Lock):
+    """Write one serialized message, one writer at a time."""
+    async with lock:
+        writer.write(data)
+        await writer.drain()
+
+
+async def _get_tools_list_result(client: Client) -> bytes:
+    """Return the serialized tools/list result, fetching it once from the daemon."""
+    global _tools_list_result
+
+    if _tools_list_result is None:
+        tools = await client.list_tools()
+        _tools_list_result = dumps_bytes({
+            "tools": [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "inputSchema": tool.inputSchema
                 }
+                for tool in tools
+            ]
+        })
+
+    return _tools_list_result
+
+
+def _progress_relay(writer: asyncio.StreamWriter, lock: asyncio.Lock, progress_token):
+    """Build a progress handler that forwards daemon progress to the stdio client."""
+    async def relay(progress: float, total: float | None, message: str | None):
+        notification_params = {"progressToken": progress_token, "progress": progress}
+        if total is not None:
+            notification_params["total"] = total
+        if message is not None:
+            notification_params["message"] = message
+
+        await _write_message(writer, {
+            "jsonrpc": "2.0",
+            "method": "notifications/progress",
+            "params": notification_params
+        }, lock)
+
+    return relay
 
-            # Write response to stdout
-            sys.stdout.write(json.dumps(response) + "\n")
-            sys.stdout.flush()
 
-        except json.JSONDecodeError as e:
-            # Invalid JSON, write error
-            error_response = {
+async def _dispatch(
+    request: Any,
+    client: Client,
+    writer: asyncio.StreamWriter,
+    lock: asyncio.Lock,
+):
+    """Handle one JSON-RPC request and write its response."""
+    if not isinstance(request, dict):
+        # Valid JSON but not a request object (e.g. an unsupported batch array)
+        await _write_message(writer, {
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {
+                "code": -32600,
+                "message": "Invalid Request"
+            }
+        }, lock)
+        return
+
+    # Handle different MCP methods
+    method = request.get("method")
+    params = request.get("params", {})
+    request_id = request.get("id")
+
+    try:
+        if method == "initialize":
+            # MCP initialization
+            await _write_result(writer, request_id, _INITIALIZE_RESULT, lock)
+            return
+
+        elif method == "tools/list":
+            # List tools from HTTP server (cached after the first request)
+            result = await _get_tools_list_result(client)
+            await _write_result(writer, request_id, result, lock)
+            return
+
+        elif method == "tools/call":
+            # Forward tool call to HTTP server
+            tool_name = params.get("name")
+            tool_args = params.get("arguments", {})
+
+            # Relay progress (e.g. claudy_call's streamed text) only if the caller asked for it
+            progress_token = (params.get("_meta") or {}).get("progressToken")
+            progress_handler = None
+            if progress_token is not None:
+                progress_handler = _progress_relay(writer, lock, progress_token)
+
+            result = await client.call_tool(
+                tool_name, tool_args, progress_handler=progress_handler
+            )
+
+            response = {
                 "jsonrpc": "2.0",
-                "id": None,
+                "id": request_id,
+                "result": {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": result.data
+                        }
+                    ]
+                }
+            }
+
+        else:
+            # Unknown method
+            response = {
+                "jsonrpc": "2.0",
+                "id": request_id,
                 "error": {
-                    "code": -32700,
-                    "message": f"Parse error: {str(e)}"
+                    "code": -32601,
+                    "message": f"Method not found: {method}"
                 }
             }
-            sys.stdout.write(json.dumps(error_response) + "\n")
-            sys.stdout.flush()
 
-        except Exception as e:
-            # Other errors
-            sys.stderr.write(f"Error in stdio proxy: {str(e)}\n")
-            sys.stderr.flush()
-            break
+    except Exception as e:
+        response = {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {
+                "code": -32603,
+                "message": f"Internal error: {str(e)}"
+            }
+        }
+
+    # Write response to stdout
+    await _write_message(writer, response, lock)
+
+
+async def _handle_stdio_loop(
+    client: Client,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+):
+    """Handle stdio loop with connected client.
+
+    Each request runs as its own task so a slow tools/call does not hold up the
+    requests behind it; responses carry the request id and may arrive out of order.
+    """
+    write_lock = asyncio.Lock()
+    # Strong references keep in-flight requests from being garbage collected
+    pending: set[asyncio.Task] = set()
+
+    # MCP stdio protocol: read JSON-RPC from stdin, write to stdout
+    try:
+        while True:
+            try:
+                # Read line from stdin
+                line = await reader.readline()
+
+                if not line:
+                    break  # EOF
+
+                # Parse JSON-RPC request (bytes in, surrounding whitespace is allowed)
+                request = loads(line)
+
+                task = asyncio.create_task(_dispatch(request, client, writer, write_lock))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+            except JSONDecodeError as e:
+                # Invalid JSON, write error
+                error_response = {
+                    "jsonrpc": "2.0",
+                    "id": None,
+                    "error": {
+                        "code": -32700,
+                        "message": f"Parse error: {str(e)}"
+                    }
+                }
+                await _write_message(writer, error_response, write_lock)
+
+            except Exception as e:
+                # Other errors
+                sys.stderr.write(f"Error in stdio proxy: {str(e)}\n")
+                sys.stderr.flush()
+                break
+    finally:
+        # Let in-flight requests finish and answer before the client is closed
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
 
 
 async def run_stdio_proxy():
     """Run stdio MCP server that forwards to HTTP daemon."""
+    reader, writer = await _open_stdio()
+
     # Connect to HTTP daemon (with retries)
     max_retries = 5
     retry_delay = 1
 
     for attempt in range(max_retries):
         try:
-            client = Client(f"http://{DEFAULT_HOST}:{DEFAULT_PORT}/mcp")
+            client = create_client()
             # Try to connect
             async with client:
                 # Successfully connected, handle stdio loop
-                await _handle_stdio_loop(client)
+                await _handle_stdio_loop(client, reader, writer)
                 return
         except Exception as e:
             if attempt < max_retries - 1:
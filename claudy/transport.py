@@ -0,0 +1,87 @@
+"""Client transport selection for talking to the Claudy daemon."""
+
+from functools import partial
+
+import httpx
+from fastmcp import Client
+from fastmcp.client.transports import StreamableHttpTransport
+
+try:
+    from .config import (
+        DEFAULT_HOST,
+        DEFAULT_PORT,
+        HTTP_KEEPALIVE_EXPIRY,
+        HTTP_MAX_CONNECTIONS,
+        HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        SERVER_TIMEOUT,
+        SOCKET_FILE,
+        get_server_port,
+    )
+except ImportError:
+    from claudy.config import (
+        DEFAULT_HOST,
+        DEFAULT_PORT,
+        HTTP_KEEPALIVE_EXPIRY,
+        HTTP_MAX_CONNECTIONS,
+        HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        SERVER_TIMEOUT,
+        SOCKET_FILE,
+        get_server_port,
+    )
+
+# Concurrent tool calls each hold a connection while streaming, so keep enough
+# of them pooled that a fan-out reuses connections instead of reconnecting
+_LIMITS = httpx.Limits(
+    max_connections=HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+)
+
+
+def _client_factory(
+    headers: dict[str, str] | None = None,
+    timeout: httpx.Timeout | None = None,
+    auth: httpx.Auth | None = None,
+    uds: str | None = None,
+) -> httpx.AsyncClient:
+    """Create the httpx client used by the MCP transport.
+
+    Speaks HTTP/1.1 with a keep-alive pool, over the daemon's Unix socket when
+    uds is given. HTTP/2 is not used: uvicorn does not serve it.
+    """
+    if timeout is None:
+        # Same defaults as the MCP SDK: long read timeout for streamed responses
+        timeout = httpx.Timeout(30.0, read=300.0)
+
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(uds=uds, limits=_LIMITS),
+        headers=headers,
+        timeout=timeout,
+        auth=auth,
+        follow_redirects=True,
+    )
+
+
+def create_client() -> Client:
+    """Create a FastMCP client for the running daemon.
+
+    Uses the Unix socket when the daemon was started in socket mode (the default),
+    otherwise falls back to HTTP over TCP on the saved port.
+
+    The MCP initialize handshake gets SERVER_TIMEOUT instead of FastMCP's short
+    default, so a freshly started or busy daemon is waited on rather than
+    reported as failed.
+    """
+    if SOCKET_FILE.exists():
+        # Host is ignored by the socket transport, it only fills the Host header
+        transport = StreamableHttpTransport(
+            "http://localhost/mcp",
+            httpx_client_factory=partial(_client_factory, uds=str(SOCKET_FILE)),
+        )
+    else:
+        port = get_server_port() or DEFAULT_PORT
+        transport = StreamableHttpTransport(
+            f"http://{DEFAULT_HOST}:{port}/mcp", httpx_client_factory=_client_factory
+        )
+
+    return Client(transport, init_timeout=SERVER_TIMEOUT)
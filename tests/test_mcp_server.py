@@ -0,0 +1,154 @@
+"""Tests for background task bookkeeping and idle session cleanup."""
+
+import asyncio
+import json
+
+import pytest
+from fastmcp import Client
+
+from claudy import mcp_server
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    """Give each test its own session/task storage, locks and expiry heap."""
+    sessions_lock = asyncio.Lock()
+    monkeypatch.setattr(mcp_server, "_global_sessions", {})
+    monkeypatch.setattr(mcp_server, "_background_tasks", {})
+    monkeypatch.setattr(mcp_server, "_superseded_tasks", set())
+    monkeypatch.setattr(mcp_server, "_expiry_heap", [])
+    monkeypatch.setattr(mcp_server, "_sessions_lock", sessions_lock)
+    monkeypatch.setattr(mcp_server, "_tasks_lock", asyncio.Lock())
+    monkeypatch.setattr(mcp_server, "_cleanup_cv", asyncio.Condition(sessions_lock))
+
+
+@pytest.fixture
+def gates(monkeypatch):
+    """Replace agent calls with ones that finish when their message's gate is set."""
+    gates = {}
+
+    async def fake_execute_call(name, message, verbosity="normal", **kwargs):
+        await gates.setdefault(message, asyncio.Event()).wait()
+        return {"success": True, "name": name, "response": message}
+
+    monkeypatch.setattr(mcp_server, "_execute_call", fake_execute_call)
+    return gates
+
+
+def _release(gates: dict, message: str):
+    gates.setdefault(message, asyncio.Event()).set()
+
+
+async def _call(client: Client, tool: str, **arguments) -> dict:
+    result = await client.call_tool(tool, arguments)
+    return json.loads(result.data)
+
+
+async def _settle():
+    """Let released background tasks finish and run their done callbacks."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_call_async_refuses_once_cap_is_reached(monkeypatch, gates):
+    monkeypatch.setattr(mcp_server, "MAX_BACKGROUND_TASKS", 2)
+
+    async with Client(mcp_server.mcp) as client:
+        assert (await _call(client, "claudy_call_async", name="a", message="a1"))["success"]
+        assert (await _call(client, "claudy_call_async", name="b", message="b1"))["success"]
+
+        refused = await _call(client, "claudy_call_async", name="c", message="c1")
+        assert refused["success"] is False
+        assert "Too many uncollected background tasks" in refused["error"]
+
+        # Finished but uncollected results still hold their slots
+        _release(gates, "a1")
+        _release(gates, "b1")
+        await _settle()
+        refused = await _call(client, "claudy_call_async", name="c", message="c1")
+        assert refused["success"] is False
+
+        collected = await _call(client, "claudy_get_results", names=["a", "b"])
+        assert collected["results"]["a"]["response"] == "a1"
+        assert collected["results"]["b"]["response"] == "b1"
+
+        assert (await _call(client, "claudy_call_async", name="c", message="c1"))["success"]
+
+
+@pytest.mark.asyncio
+async def test_superseded_running_task_holds_its_slot(monkeypatch, gates):
+    monkeypatch.setattr(mcp_server, "MAX_BACKGROUND_TASKS", 2)
+
+    async with Client(mcp_server.mcp) as client:
+        assert (await _call(client, "claudy_call_async", name="a", message="a1"))["success"]
+        assert (await _call(client, "claudy_call_async", name="a", message="a2"))["success"]
+        assert len(mcp_server._superseded_tasks) == 1
+
+        refused = await _call(client, "claudy_call_async", name="b", message="b1")
+        assert refused["success"] is False
+
+        # The superseded call frees its slot once it finishes
+        _release(gates, "a1")
+        await _settle()
+        assert not mcp_server._superseded_tasks
+        assert (await _call(client, "claudy_call_async", name="b", message="b1"))["success"]
+
+        _release(gates, "a2")
+        collected = await _call(client, "claudy_get_results", names=["a"])
+        assert collected["results"]["a"]["response"] == "a2"
+
+
+@pytest.mark.asyncio
+async def test_finished_task_is_replaced_under_the_same_name(monkeypatch, gates):
+    monkeypatch.setattr(mcp_server, "MAX_BACKGROUND_TASKS", 1)
+
+    async with Client(mcp_server.mcp) as client:
+        assert (await _call(client, "claudy_call_async", name="a", message="a1"))["success"]
+        _release(gates, "a1")
+        await _settle()
+
+        # The finished result is replaced rather than counted against the cap
+        assert (await _call(client, "claudy_call_async", name="a", message="a2"))["success"]
+        assert not mcp_server._superseded_tasks
+
+        _release(gates, "a2")
+        collected = await _call(client, "claudy_get_results", names=["a"])
+        assert collected["results"]["a"]["response"] == "a2"
+
+
+class _FakeSDKClient:
+    """ClaudeSDKClient stand-in that records disconnects instead of running the CLI."""
+
+    instances = []
+
+    def __init__(self, options=None):
+        self.disconnected = asyncio.Event()
+        self.instances.append(self)
+
+    async def connect(self):
+        pass
+
+    async def disconnect(self):
+        self.disconnected.set()
+
+
+@pytest.mark.asyncio
+async def test_idle_session_is_cleaned_up_after_timeout(monkeypatch):
+    monkeypatch.setattr(mcp_server, "ClaudeSDKClient", _FakeSDKClient)
+    monkeypatch.setattr(mcp_server, "SESSION_IDLE_TIMEOUT", 0.05)
+    _FakeSDKClient.instances.clear()
+
+    # Start with no sessions, so cleanup waits on the condition until one is touched
+    cleanup_task = asyncio.create_task(mcp_server.cleanup_idle_sessions())
+    try:
+        await _settle()
+        await mcp_server.get_or_create_session("idle")
+        assert "idle" in mcp_server._global_sessions
+
+        (client,) = _FakeSDKClient.instances
+        await asyncio.wait_for(client.disconnected.wait(), timeout=2.0)
+        assert "idle" not in mcp_server._global_sessions
+    finally:
+        cleanup_task.cancel()
+        await asyncio.gather(cleanup_task, return_exceptions=True)
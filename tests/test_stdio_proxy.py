@@ -0,0 +1,88 @@
+"""Tests for the stdio-to-daemon proxy."""
+
+import asyncio
+import json
+
+import pytest
+from fastmcp import Client, Context, FastMCP
+
+from claudy.stdio_proxy import _dispatch
+
+
+class _CaptureWriter:
+    """StreamWriter stand-in that records the JSON-RPC messages written to stdout."""
+
+    def __init__(self):
+        self.messages = []
+
+    def write(self, data: bytes):
+        self.messages.extend(json.loads(line) for line in data.splitlines())
+
+    async def drain(self):
+        pass
+
+
+def _daemon() -> FastMCP:
+    """A stand-in daemon whose tool streams text as progress, like claudy_call."""
+    server = FastMCP("daemon")
+
+    @server.tool
+    async def stream(ctx: Context) -> str:
+        await ctx.report_progress(progress=5, message="hello")
+        await ctx.report_progress(progress=11, message="world!")
+        return "hello world!"
+
+    return server
+
+
+def _tools_call(meta: dict | None = None) -> dict:
+    params = {"name": "stream", "arguments": {}}
+    if meta is not None:
+        params["_meta"] = meta
+    return {"jsonrpc": "2.0", "id": 7, "method": "tools/call", "params": params}
+
+
+@pytest.mark.asyncio
+async def test_tools_call_relays_progress_for_progress_token():
+    writer = _CaptureWriter()
+
+    async with Client(_daemon()) as client:
+        await _dispatch(_tools_call({"progressToken": "tok"}), client, writer, asyncio.Lock())
+
+    *progress, response = writer.messages
+    assert progress == [
+        {
+            "jsonrpc": "2.0",
+            "method": "notifications/progress",
+            "params": {"progressToken": "tok", "progress": 5, "message": "hello"},
+        },
+        {
+            "jsonrpc": "2.0",
+            "method": "notifications/progress",
+            "params": {"progressToken": "tok", "progress": 11, "message": "world!"},
+        },
+    ]
+    assert response["id"] == 7
+    assert response["result"]["content"][0]["text"] == "hello world!"
+
+
+@pytest.mark.asyncio
+async def test_tools_call_without_progress_token_sends_only_the_response():
+    writer = _CaptureWriter()
+
+    async with Client(_daemon()) as client:
+        await _dispatch(_tools_call(), client, writer, asyncio.Lock())
+
+    assert [message.get("id") for message in writer.messages] == [7]
+
+
+@pytest.mark.asyncio
+async def test_non_object_frame_gets_invalid_request_error():
+    writer = _CaptureWriter()
+
+    async with Client(_daemon()) as client:
+        await _dispatch([1, 2], client, writer, asyncio.Lock())
+
+    assert writer.messages == [
+        {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+    ]